@@ -14,96 +14,205 @@ Highlights:
 - Optional captions under thumbnails (--labels).
 - Film-like ordering option (--order) to fill columns bottom->top like 35mm strips.
 
-Dependencies: Pillow, reportlab
+Dependencies: Pillow (>= 9.1), reportlab
+Optional: pyvips (libvips) -- when installed, thumbnails are decoded, rotated
+and shrunk on load by libvips instead of Pillow (--resample then has no effect).
+
+Performance (optional):
+- On x86-64, Pillow-SIMD is a drop-in replacement that speeds up resizing
+  considerably (requires SSE4/AVX2); it must also be 9.1 or newer:
+      pip uninstall pillow && pip install "pillow-simd>=9.1"
+- On other targets, building Pillow from source against libjpeg-turbo gives
+  faster JPEG decoding:
+      pip3 install --no-binary :all: --force-reinstall pillow
 """
 
 import argparse
+import enum
+import hashlib
 import math
+import os
+import platform
+import queue
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from io import BytesIO
 from pathlib import Path
-from typing import List, Tuple
+from itertools import islice
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
-from PIL import Image, ImageOps
+import PIL
+from PIL import Image
+from reportlab import rl_config
 from reportlab.pdfgen import canvas
+from reportlab.lib.utils import ImageReader
 from reportlab.lib.pagesizes import A4, landscape as rl_landscape, portrait as rl_portrait
 from reportlab.lib.units import mm
 
+try:
+    import pyvips
+except (ImportError, OSError):  # not installed, or libvips missing
+    pyvips = None
+
 
 # ----------------------------- Utilities -----------------------------
 
 IMG_EXTS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".webp"}
 
+RESAMPLE_FILTERS = {
+    "lanczos": Image.Resampling.LANCZOS,
+    "bicubic": Image.Resampling.BICUBIC,
+    "bilinear": Image.Resampling.BILINEAR,
+    "hamming": Image.Resampling.HAMMING,
+}
+
+# Modes resized before converting to RGB. Anything else is converted first:
+# palette and bilevel images only support NEAREST, and RGBA/LA are resampled
+# with premultiplied alpha, which would turn transparent areas black.
+RESAMPLE_MODES = {"RGB", "L", "CMYK", "I", "F"}
+
+# Thumbnails are embedded into the PDF as JPEG streams of this quality (--jpeg-quality)
+DEFAULT_JPEG_QUALITY = 82
+
+# Default location of the on-disk thumbnail cache
+DEFAULT_CACHE_DIR = Path("~/.cache/film-contact-sheet")
+
+# With --resample auto, thumbnails smaller than this (long side, px) use bilinear
+AUTO_RESAMPLE_LIMIT = 400
+
+# Default --jobs allows one worker per this much available memory (at least 2)
+WORKER_MEMORY = 256 * 1024 * 1024
+
+# Images still larger than this after the JPEG draft (e.g. huge TIFF/PNG scans)
+# are decoded by at most two workers at a time to bound peak memory
+LARGE_IMAGE_PIXELS = 50_000_000
+LARGE_IMAGE_SLOTS = threading.BoundedSemaphore(2)
+
 
 def find_images(input_dir: Path) -> List[Path]:
     """Return a sorted list of image files in the given directory."""
-    files: List[Path] = []
-    for ext in IMG_EXTS:
-        files.extend(sorted(input_dir.glob(f"*{ext}")))
-        files.extend(sorted(input_dir.glob(f"*{ext.upper()}")))
-    # De-duplicate while preserving order
-    seen = set()
-    out: List[Path] = []
-    for p in files:
-        if p.exists() and p.suffix.lower() in IMG_EXTS and p not in seen:
-            out.append(p)
-            seen.add(p)
-    return out
-
-
-def normalize_exif(img: Image.Image) -> Image.Image:
-    """Apply EXIF orientation if present (no-op on failure)."""
-    try:
-        return ImageOps.exif_transpose(img)
-    except Exception:
-        return img
+    # A single directory scan; DirEntry.is_file() usually needs no extra stat()
+    with os.scandir(input_dir) as it:
+        return sorted(
+            Path(e.path) for e in it
+            if os.path.splitext(e.name)[1].lower() in IMG_EXTS and e.is_file()
+        )
+
+
+EXIF_ORIENTATION = 0x0112
 
 
-def unify_orientation(img: Image.Image, mode: str) -> Image.Image:
+class UniformOrient(enum.IntEnum):
+    """--uniform-orient choices; parsed once so per-image checks compare ints."""
+    NONE = 0
+    PORTRAIT = 1
+    LANDSCAPE = 2
+
+
+_T = Image.Transpose
+
+# Single transpose that applies EXIF orientation (key, 1..8) followed by an
+# optional quarter turn: (keep, 90° counter-clockwise, 90° clockwise).
+# None means the image is already in its final orientation.
+ORIENT_TRANSPOSE = {
+    1: (None, _T.ROTATE_90, _T.ROTATE_270),
+    2: (_T.FLIP_LEFT_RIGHT, _T.TRANSPOSE, _T.TRANSVERSE),
+    3: (_T.ROTATE_180, _T.ROTATE_270, _T.ROTATE_90),
+    4: (_T.FLIP_TOP_BOTTOM, _T.TRANSVERSE, _T.TRANSPOSE),
+    5: (_T.TRANSPOSE, _T.FLIP_TOP_BOTTOM, _T.FLIP_LEFT_RIGHT),
+    6: (_T.ROTATE_270, None, _T.ROTATE_180),
+    7: (_T.TRANSVERSE, _T.FLIP_LEFT_RIGHT, _T.FLIP_TOP_BOTTOM),
+    8: (_T.ROTATE_90, _T.ROTATE_180, None),
+}
+
+# Transposes that swap width and height
+AXIS_SWAPPING = {_T.ROTATE_90, _T.ROTATE_270, _T.TRANSPOSE, _T.TRANSVERSE}
+
+
+def orientation_transpose(img: Image.Image, mode: UniformOrient) -> Optional[Image.Transpose]:
     """
-    Return a new Image with the requested orientation applied.
-    mode: 'none' | 'portrait' | 'landscape'
-    Source files on disk are never modified.
+    Return the single transpose that applies EXIF orientation and the requested
+    uniform orientation, or None if the image needs no change.
+    Only reads the header, so it can be called before the pixels are decoded.
     """
-    if mode == "none":
-        return img
+    try:
+        orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+    except Exception:
+        orientation = 1
+    if orientation not in ORIENT_TRANSPOSE:
+        orientation = 1
 
+    # Size as displayed, i.e. after the EXIF step (5..8 swap the axes)
     w, h = img.size
+    if orientation >= 5:
+        w, h = h, w
+    return ORIENT_TRANSPOSE[orientation][uniform_turn(w, h, mode)]
+
+
+def uniform_turn(w: int, h: int, mode: UniformOrient) -> int:
+    """
+    Quarter turn needed to bring an upright w x h image to the uniform
+    orientation: 0 = none, 1 = 90° counter-clockwise, 2 = 90° clockwise.
+    """
     is_portrait = h >= w
-    if mode == "portrait" and not is_portrait:
-        return img.rotate(90, expand=True)
-    if mode == "landscape" and is_portrait:
-        return img.rotate(-90, expand=True)
-    return img
+    if mode == UniformOrient.PORTRAIT and not is_portrait:
+        return 1
+    if mode == UniformOrient.LANDSCAPE and is_portrait:
+        return 2
+    return 0
+
+
+def choose_resample(name: str, cell_w: float, cell_h: float) -> Image.Resampling:
+    """
+    Map a --resample choice to a Pillow filter.
+    'auto' picks bilinear for small cells (the difference to LANCZOS is not
+    visible at contact-sheet scale) and LANCZOS for larger ones.
+    """
+    if name == "auto":
+        name = "bilinear" if max(cell_w, cell_h) < AUTO_RESAMPLE_LIMIT else "lanczos"
+    return RESAMPLE_FILTERS[name]
 
 
 def choose_grid_auto(n: int, page_w_pt: float, page_h_pt: float,
                      margin_pt: float, gap_pt: float) -> Tuple[int, int]:
     """
-    Simple automatic grid selection: brute-force plausible (rows, cols) and
-    pick the one maximizing cell area within the usable page rectangle.
+    Simple automatic grid selection: start from the column count that makes
+    cells closest to square, cols ≈ sqrt(n * usable_w / usable_h), then pick
+    the neighbour (cols-1..cols+1) maximizing cell area within the usable
+    page rectangle.
     Returns (rows, cols).
     """
     usable_w = page_w_pt - 2 * margin_pt
     usable_h = page_h_pt - 2 * margin_pt
 
-    best = (1, n)  # fallback
-    best_area = -1.0
+    cols = round(math.sqrt(n * usable_w / max(usable_h, 1)))
+    cols = min(max(1, cols), max(1, n))
 
-    # Reasonable search bounds
-    for rows in range(1, min(15, n) + 1):
-        cols = math.ceil(n / rows)
-        if cols > 30:  # hard cap
-            continue
+    # Shrink until the gaps leave room for the cells
+    while cols > 1 and (usable_w - gap_pt * (cols - 1)) / cols <= 0:
+        cols -= 1
+
+    best = None
+    best_area = -1.0
+    for cand_cols in range(max(1, cols - 1), min(cols + 1, max(1, n)) + 1):
+        rows = math.ceil(n / cand_cols)
 
         # Cell size given rows/cols and gaps
-        cell_w = (usable_w - gap_pt * (cols - 1)) / cols
+        cell_w = (usable_w - gap_pt * (cand_cols - 1)) / cand_cols
         cell_h = (usable_h - gap_pt * (rows - 1)) / rows
         if cell_w <= 0 or cell_h <= 0:
             continue
         area = cell_w * cell_h
         if area > best_area:
             best_area = area
-            best = (rows, cols)
+            best = (rows, cand_cols)
 
+    if best is None:
+        raise SystemExit(f"Cannot fit {n} images on one page with these margins and gaps; "
+                         "set --rows/--cols or reduce --gap-mm / --margin-mm.")
     return best
 
 
@@ -112,10 +221,7 @@ def paginate(n: int, per_page: int) -> List[Tuple[int, int]]:
     Return a list of (start, end) index pairs for each page.
     'end' is exclusive.
     """
-    pages: List[Tuple[int, int]] = []
-    for i in range(0, n, per_page):
-        pages.append((i, min(i + per_page, n)))
-    return pages
+    return [(i, min(i + per_page, n)) for i in range(0, n, per_page)]
 
 
 def index_to_cell(idx: int, rows: int, cols: int, order: str):
@@ -144,22 +250,19 @@ def index_to_cell(idx: int, rows: int, cols: int, order: str):
         return r, c
 
 
-def draw_page(
-    c: canvas.Canvas,
-    images: List[Path],
-    rows: int,
-    cols: int,
-    margin_pt: float,
-    gap_pt: float,
-    page_w_pt: float,
-    page_h_pt: float,
-    uniform_orient: str,
-    labels: str,
-    order: str,
-    font_name: str = "Helvetica",
-    font_size: int = 7,
-) -> None:
-    """Render a single grid page onto the canvas."""
+class GridLayout(NamedTuple):
+    """Cell size and cell positions (lower-left corners) of a page grid."""
+    cell_w: float
+    cell_h: float
+    positions: List[Tuple[float, float]]  # indexed by linear cell index
+
+
+def grid_layout(rows: int, cols: int, margin_pt: float, gap_pt: float,
+                page_w_pt: float, page_h_pt: float, order: str) -> GridLayout:
+    """
+    Compute the grid geometry once; it is the same for every page.
+    Positions follow the fill order, see index_to_cell().
+    """
     usable_w = page_w_pt - 2 * margin_pt
     usable_h = page_h_pt - 2 * margin_pt
 
@@ -169,50 +272,335 @@ def draw_page(
     # Start (top-left cell baseline)
     x0 = margin_pt
     y0 = page_h_pt - margin_pt - cell_h  # top row
+    step_x = cell_w + gap_pt
+    step_y = cell_h + gap_pt
 
-    c.setFont(font_name, font_size)
-
-    for idx, img_path in enumerate(images):
-        # Compute row/col based on ordering
+    positions = []
+    for idx in range(rows * cols):
         r, cidx = index_to_cell(idx, rows, cols, order)
+        positions.append((x0 + cidx * step_x, y0 - r * step_y))
+    return GridLayout(cell_w, cell_h, positions)
 
-        x = x0 + cidx * (cell_w + gap_pt)
-        y = y0 - r * (cell_h + gap_pt)
 
-        # Load and prepare image
-        with Image.open(img_path) as im:
-            im = normalize_exif(im)
-            if im.mode not in ("RGB", "L"):
-                im = im.convert("RGB")
-            im = unify_orientation(im, uniform_orient)
+def prepare_thumbnail(img_path: Path, cell_w: float, cell_h: float,
+                      uniform_orient: UniformOrient,
+                      resample: Image.Resampling = Image.Resampling.LANCZOS) -> Image.Image:
+    """
+    Load an image and return a thumbnail that fits into a cell of the given size.
+    Safe to call from worker threads: it only touches the PIL image it opens.
+    """
+    with Image.open(img_path) as im, ExitStack() as slot:
+        # Take a large-image slot before anything can decode (PNG getexif() loads
+        # the pixels). draft() only shrinks JPEGs, so those are checked after it.
+        is_jpeg = im.format == "JPEG"
+        if not is_jpeg and im.width * im.height > LARGE_IMAGE_PIXELS:
+            slot.enter_context(LARGE_IMAGE_SLOTS)
+
+        # Source files on disk are never modified; orientation only affects the thumbnail
+        op = orientation_transpose(im, uniform_orient)
+
+        # Let libjpeg decode at a reduced DCT scale (1/2, 1/4, 1/8) while keeping
+        # at least twice the cell resolution (in source axes, i.e. before the
+        # transpose). No-op for non-JPEG formats.
+        draft_box = (max(1, int(cell_w * 2)), max(1, int(cell_h * 2)))
+        if op in AXIS_SWAPPING:
+            draft_box = draft_box[::-1]
+        im.draft("RGB", draft_box)
+
+        if is_jpeg and im.width * im.height > LARGE_IMAGE_PIXELS:
+            slot.enter_context(LARGE_IMAGE_SLOTS)
+
+        if op is not None:
+            im = im.transpose(op)
+        if im.mode not in RESAMPLE_MODES:
+            im = im.convert("RGB")
+
+        # Scale to fit cell while preserving aspect
+        iw, ih = im.size
+        scale = min(cell_w / iw, cell_h / ih)
+        new_w = max(1, int(iw * scale))
+        new_h = max(1, int(ih * scale))
+
+        im.thumbnail((new_w, new_h), resample)
+
+        # Color conversion after resizing only touches the thumbnail's pixels
+        if im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        return im
+
+
+def vips_thumbnail(img_path: Path, cell_w: float, cell_h: float,
+                   uniform_orient: UniformOrient,
+                   quality: int = DEFAULT_JPEG_QUALITY) -> bytes:
+    """
+    libvips counterpart of prepare_thumbnail() + encode_thumbnail(): shrink-on-load
+    and EXIF rotation run in C without holding the full image in memory.
+    Returns JPEG data with the same size and orientation as the Pillow path.
+    """
+    # Header only: displayed size (after EXIF rotation) decides the quarter turn
+    src = pyvips.Image.new_from_file(str(img_path))
+    w, h = src.width, src.height
+    if src.get_typeof("orientation") and src.get("orientation") >= 5:
+        w, h = h, w
+    turn = uniform_turn(w, h, uniform_orient)
+
+    box_w, box_h = max(1, int(cell_w)), max(1, int(cell_h))
+    if turn:
+        box_w, box_h = box_h, box_w
+    if src.hasalpha():
+        # vips shrinks with premultiplied alpha, which would turn transparent
+        # areas black; drop alpha first, like convert("RGB") on the Pillow path
+        # (this gives up shrink-on-load for these images)
+        src = src.extract_band(0, n=src.bands - 1)
+        thumb = src.thumbnail_image(box_w, height=box_h, size="down")
+    else:
+        thumb = pyvips.Image.thumbnail(str(img_path), box_w, height=box_h, size="down")
+    if turn == 1:
+        thumb = thumb.rot270()  # vips turns clockwise
+    elif turn == 2:
+        thumb = thumb.rot90()
 
-            # Scale to fit cell while preserving aspect
-            iw, ih = im.size
-            scale = min(cell_w / iw, cell_h / ih)
-            new_w = max(1, int(iw * scale))
-            new_h = max(1, int(ih * scale))
+    # 8-bit RGB or grayscale, like the Pillow path
+    if thumb.format != "uchar" or thumb.interpretation not in ("srgb", "b-w"):
+        thumb = thumb.colourspace("b-w" if thumb.bands == 1 else "srgb")
+    return thumb.jpegsave_buffer(Q=quality, optimize_coding=True, interlace=True, strip=True)
 
-            im = im.copy()
-            im.thumbnail((new_w, new_h), Image.LANCZOS)
 
-            # Center inside the cell
-            offset_x = x + (cell_w - im.width) / 2
-            offset_y = y + (cell_h - im.height) / 2
+def encode_thumbnail(im: Image.Image, quality: int = DEFAULT_JPEG_QUALITY) -> bytes:
+    """
+    Encode a prepared thumbnail (RGB or L) as an optimized progressive JPEG.
+    Chroma subsampling (4:2:0) is not visible at thumbnail size.
+    """
+    buf = BytesIO()
+    im.save(buf, "JPEG", quality=quality, optimize=True, progressive=True, subsampling=2)
+    return buf.getvalue()
+
+
+class ThumbnailReader(ImageReader):
+    """
+    ImageReader for encoded thumbnail JPEG data.
+    ReportLab embeds JPEG data as-is, so no encoding is left for the canvas.
+    """
+
+    def __init__(self, data: bytes):
+        super().__init__(BytesIO(data))
+        # getRGBData() below returns a digest, not pixels; that is only safe
+        # while ReportLab embeds the stream through jpeg_fh(). Fail loudly
+        # instead of embedding the digest as image data.
+        if self.jpeg_fh() is None:
+            raise ValueError("ThumbnailReader requires JPEG data")
+        self._digest = hashlib.blake2b(data, digest_size=12).digest()
+        self._dataA = None  # ReportLab internal read by drawImage(): no soft mask
+
+    def getRGBData(self):
+        # drawImage() only calls this to name the image XObject (JPEG data is
+        # embedded through jpeg_fh()). Naming by a digest of the encoded data
+        # skips decoding the pixels, and identical thumbnails still share one
+        # XObject across the whole document.
+        return self._digest
+
+
+def thumbnail_cache_key(img_path: Path, cell_w: float, cell_h: float,
+                        uniform_orient: UniformOrient, resample: Image.Resampling,
+                        quality: int = DEFAULT_JPEG_QUALITY) -> str:
+    """
+    Return the cache key of a thumbnail: source path and modification time plus
+    every setting that affects the encoded result.
+    """
+    st = img_path.stat()
+    ident = (f"{img_path.resolve()}|{st.st_mtime_ns}|{cell_w:.1f}x{cell_h:.1f}|"
+             f"{uniform_orient.name}|{resample.name}|q{quality}|{'vips' if pyvips else 'pil'}")
+    return hashlib.blake2b(ident.encode()).hexdigest()[:16]
+
+
+def load_cached_thumbnail(cache_dir: Path, key: str) -> Optional[bytes]:
+    """Return cached thumbnail data, or None if it is not in the cache."""
+    try:
+        return (cache_dir / f"{key}.jpg").read_bytes()
+    except OSError:
+        return None
+
+
+def store_cached_thumbnail(cache_dir: Path, key: str, data: bytes) -> None:
+    """
+    Write thumbnail data to the cache atomically (temp file + rename), so
+    concurrent or interrupted runs never leave a truncated entry behind.
+    A cache that cannot be written is silently skipped.
+    """
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cache_dir / f"{key}.jpg")
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+class PreparedCell(NamedTuple):
+    """A thumbnail ready to be drawn, with its placement on the page."""
+    reader: ImageReader
+    x: float  # image position, already centered inside the cell
+    y: float
+    w: float
+    h: float
+    caption: str
+    caption_x: float
+    caption_y: float
+
+
+def prepare_page(
+    executor: ThreadPoolExecutor,
+    images: Iterable[Path],
+    layout: GridLayout,
+    uniform_orient: UniformOrient,
+    labels: str,
+    resample: str = "auto",
+    cache_dir: Optional[Path] = None,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+) -> List[PreparedCell]:
+    """
+    Prepare the thumbnails and placements of a single grid page.
 
-            # Draw image
-            c.drawInlineImage(im, offset_x, offset_y, width=im.width, height=im.height)
+    Thumbnails are decoded and resized on the executor's threads (Pillow
+    releases the GIL while decoding and resampling). Nothing here touches the
+    canvas, so pages can be prepared while another thread is drawing.
+    If cache_dir is given, encoded thumbnails are reused from / stored there.
+    images may be any iterable; it is consumed once.
+    """
+    cell_w, cell_h = layout.cell_w, layout.cell_h
+    resample_filter = choose_resample(resample, cell_w, cell_h)
+
+    def load(img_path: Path) -> Tuple[Path, ImageReader]:
+        key = data = None
+        if cache_dir is not None:
+            key = thumbnail_cache_key(img_path, cell_w, cell_h, uniform_orient, resample_filter,
+                                      jpeg_quality)
+            data = load_cached_thumbnail(cache_dir, key)
+        hit = data is not None
+        if data is None and pyvips is not None:
+            try:
+                data = vips_thumbnail(img_path, cell_w, cell_h, uniform_orient, jpeg_quality)
+            except pyvips.Error:
+                pass  # format not supported by this libvips build; use Pillow
+        if data is None:
+            im = prepare_thumbnail(img_path, cell_w, cell_h, uniform_orient, resample_filter)
+            data = encode_thumbnail(im, jpeg_quality)
+        if key is not None and not hit:
+            store_cached_thumbnail(cache_dir, key, data)
+        return img_path, ThumbnailReader(data)
+
+    cells: List[PreparedCell] = []
+    thumbs = executor.map(load, images)
+    for (x, y), (img_path, reader) in zip(layout.positions, thumbs):
+        w, h = reader.getSize()
 
         # Optional caption
-        if labels != "none":
-            text = ""
-            if labels == "index":
-                text = f"{img_path.stem}"
-            elif labels == "name":
-                text = img_path.name
+        text = ""
+        if labels == "index":
+            text = f"{img_path.stem}"
+        elif labels == "name":
+            text = img_path.name
+
+        cells.append(PreparedCell(
+            reader=reader,
+            # Center inside the cell
+            x=x + (cell_w - w) / 2,
+            y=y + (cell_h - h) / 2,
+            w=w,
+            h=h,
+            caption=text,
+            caption_x=x,
+            caption_y=y - 2,  # tiny offset below the cell
+        ))
+    return cells
+
+
+def prepare_pages(out: "queue.Queue", executor: ThreadPoolExecutor,
+                  images: List[Path], pages: List[Tuple[int, int]], **page_kwargs) -> None:
+    """
+    Producer loop: prepare every page in order and put it on the queue.
+    A bounded queue keeps at most a couple of pages in memory. An exception is
+    passed through the queue so the consumer can re-raise it.
+    """
+    try:
+        # One shared iterator: each page takes the next (end - start) images
+        # without copying a slice of the list
+        it = iter(images)
+        for (start, end) in pages:
+            out.put(prepare_page(executor, islice(it, end - start), **page_kwargs))
+    except BaseException as e:
+        out.put(e)
 
-            if text:
-                ty = y - 2  # tiny offset below the cell
-                c.drawString(x, ty, text)
+
+def draw_page(
+    c: canvas.Canvas,
+    cells: List[PreparedCell],
+    font_name: str = "Helvetica",
+    font_size: int = 7,
+) -> None:
+    """
+    Render a single prepared grid page onto the canvas.
+    All captions go into one text object, drawn after the images.
+    """
+    text = c.beginText()
+    text.setFont(font_name, font_size)
+    has_captions = False
+
+    draw_image = c.drawImage
+    for cell in cells:
+        draw_image(cell.reader, cell.x, cell.y, width=cell.w, height=cell.h)
+
+        if cell.caption:
+            text.setTextOrigin(cell.caption_x, cell.caption_y)
+            text.textOut(cell.caption)
+            has_captions = True
+
+    if has_captions:
+        c.drawText(text)
+
+
+def available_memory() -> Optional[int]:
+    """Return available physical memory in bytes, or None if unknown (non-Linux)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def default_jobs() -> int:
+    """
+    Number of worker threads: the CPUs this process may run on, capped by
+    available memory so that many workers holding decoded images cannot OOM.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+    avail = available_memory()
+    if avail is None:
+        return cpus
+    return min(cpus, max(2, avail // WORKER_MEMORY))
+
+
+def pillow_simd_hint() -> None:
+    """
+    Print a tip to stderr when plain Pillow does the resizing on x86-64.
+    Nothing to gain when pyvips handles decoding and resizing.
+    """
+    if pyvips is not None:
+        return
+    # Pillow-SIMD versions carry a '.postN' suffix
+    if platform.machine().lower() in ("x86_64", "amd64") and "post" not in PIL.__version__:
+        print('Tip: pip install "pillow-simd>=9.1" for faster resizing (requires SSE4/AVX2)',
+              file=sys.stderr)
 
 
 # ----------------------------- CLI & main -----------------------------
@@ -244,11 +632,33 @@ def parse_args() -> argparse.Namespace:
                    help="Grid fill order: 'row-left-right' (reading order) or "
                         "'film-bottom-up' (columns bottom→top, then next column)")
 
-    return p.parse_args()
+    p.add_argument("--resample", choices=["auto"] + list(RESAMPLE_FILTERS), default="auto",
+                   help="Thumbnail resampling filter; 'auto' uses bilinear for thumbnails "
+                        f"under {AUTO_RESAMPLE_LIMIT}px on the long side, lanczos otherwise")
+
+    p.add_argument("--jpeg-quality", type=int, default=DEFAULT_JPEG_QUALITY,
+                   help=f"JPEG quality of embedded thumbnails, 1-95 (default: {DEFAULT_JPEG_QUALITY})")
+
+    p.add_argument("--jobs", type=int, default=None,
+                   help="Number of worker threads (default: CPUs available, capped by free memory)")
+
+    p.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+                   help="Folder for cached thumbnails, reused by later runs "
+                        f"(default: {DEFAULT_CACHE_DIR})")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Do not read or write the thumbnail cache")
+
+    args = p.parse_args()
+    if not 1 <= args.jpeg_quality <= 95:
+        p.error("--jpeg-quality must be between 1 and 95")
+    if args.jobs is not None and args.jobs < 1:
+        p.error("--jobs must be at least 1")
+    return args
 
 
 def main():
     args = parse_args()
+    pillow_simd_hint()
 
     if not args.input_dir.exists() or not args.input_dir.is_dir():
         raise SystemExit(f"Input folder not found: {args.input_dir}")
@@ -280,25 +690,50 @@ def main():
 
     per_page = rows * cols
     pages = paginate(len(images), per_page)
-
-    c = canvas.Canvas(str(args.output), pagesize=(page_w_pt, page_h_pt))
-
-    for (start, end) in pages:
-        page_imgs = images[start:end]
-        draw_page(
-            c=c,
-            images=page_imgs,
-            rows=rows,
-            cols=cols,
-            margin_pt=margin_pt,
-            gap_pt=gap_pt,
-            page_w_pt=page_w_pt,
-            page_h_pt=page_h_pt,
-            uniform_orient=args.uniform_orient,
-            labels=args.labels,
-            order=args.order,
+    layout = grid_layout(rows, cols, margin_pt, gap_pt, page_w_pt, page_h_pt, args.order)
+
+    # Thumbnail cache
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir.expanduser()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Thumbnail cache disabled: {e}", file=sys.stderr)
+            cache_dir = None
+
+    # Page content streams are deflated; thumbnails are already JPEG and are
+    # embedded as-is. ASCII85 is turned off so the canvas thread does not
+    # re-encode every image stream (which also made them 25% larger).
+    rl_config.useA85 = 0
+    c = canvas.Canvas(str(args.output), pagesize=(page_w_pt, page_h_pt), pageCompression=1)
+
+    # The ReportLab canvas is not thread-safe: a producer thread prepares the
+    # next pages on the worker pool while this thread draws and serializes.
+    prepared: "queue.Queue" = queue.Queue(maxsize=2)
+    jobs = args.jobs or default_jobs()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        producer = threading.Thread(
+            target=prepare_pages,
+            args=(prepared, executor, images, pages),
+            kwargs=dict(
+                layout=layout,
+                uniform_orient=UniformOrient[args.uniform_orient.upper()],
+                labels=args.labels,
+                resample=args.resample,
+                cache_dir=cache_dir,
+                jpeg_quality=args.jpeg_quality,
+            ),
+            daemon=True,
         )
-        c.showPage()
+        producer.start()
+
+        for _ in pages:
+            cells = prepared.get()
+            if isinstance(cells, BaseException):
+                raise cells
+            draw_page(c, cells)
+            c.showPage()
 
     c.save()
 